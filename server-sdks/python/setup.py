@@ -30,6 +30,15 @@ setup(
         "requests>=2.31.0",
     ],
     extras_require={
+        "async": [
+            "httpx[http2]>=0.27.0",
+        ],
+        "speedups": [
+            "orjson>=3.9.0",
+        ],
+        "streaming": [
+            "ijson>=3.1.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
@@ -3,26 +3,70 @@
 Tests for GroupVAN API Client
 """
 
+import functools
+import http.server
+import io
+import os
+import subprocess
+import sys
+import threading
 import unittest
-from unittest.mock import patch, Mock
+from unittest.mock import AsyncMock, patch, Mock
 import jwt
+import json
 import time
-import math
-from client import GroupVANClient, generate_rsa_key_pair
+from client import (
+    AsyncGroupVANClient,
+    GroupVANClient,
+    JWTVerifier,
+    PerformanceWarning,
+    _cryptography_openssl_cflags,
+    _json_dumps,
+    check_openssl_asm,
+    generate_ec_key_pair,
+    generate_ed25519_key_pair,
+    generate_rsa_key_pair,
+)
+
+# RSA key generation dominates test time, so each key size is generated once
+cached_rsa_key_pair = functools.cache(generate_rsa_key_pair)
+
+try:
+    import httpx  # noqa: F401
+
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+
+try:
+    import ijson  # noqa: F401
+
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
 
 
 class TestGroupVANClient(unittest.TestCase):
     """Test cases for GroupVAN API Client"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Generate the RSA key pair shared by all tests"""
+        cls.private_key, cls.public_key = cached_rsa_key_pair(2048)
+
     def setUp(self):
         """Set up test fixtures"""
-        self.private_key, self.public_key = generate_rsa_key_pair()
         self.client = GroupVANClient(
             developer_id="test_dev_123",
             key_id="test_key_456",
             private_key_pem=self.private_key,
         )
 
+    def tearDown(self):
+        """Release the client's HTTP session"""
+        self.client.close()
+
     def test_generate_rsa_key_pair(self):
         """Test RSA key pair generation"""
         private_key, public_key = generate_rsa_key_pair()
@@ -37,6 +81,51 @@ class TestGroupVANClient(unittest.TestCase):
         self.assertIn("BEGIN PUBLIC KEY", public_key)
         self.assertIn("END PUBLIC KEY", public_key)
 
+    def test_invalid_private_key(self):
+        """Test that an invalid private key is rejected at construction"""
+        with self.assertRaises(ValueError):
+            GroupVANClient(
+                developer_id="test_dev_123",
+                key_id="test_key_456",
+                private_key_pem="not a pem",
+            )
+
+    def test_clients_share_parsed_key(self):
+        """Test that clients built from the same PEM reuse the parsed key"""
+        other = GroupVANClient(
+            developer_id="other_dev",
+            key_id="other_key",
+            private_key_pem=self.private_key,
+        )
+        self.assertIs(other._private_key, self.client._private_key)
+        other.close()
+
+    def test_warm_up_once_per_key(self):
+        """Test that only the first load of a key makes a warm-up signature"""
+        private_key, _ = generate_ed25519_key_pair()
+        with patch("client._warm_up") as mock_warm_up:
+            first = GroupVANClient("dev", "key", private_key)
+            second = GroupVANClient("dev", "key", private_key)
+            shared = GroupVANClient.from_shared_key("dev", "key", first._private_key)
+        mock_warm_up.assert_called_once_with(first._private_key)
+        for client in (first, second, shared):
+            client.close()
+
+    def test_from_shared_key(self):
+        """Test building a client around an already-loaded key"""
+        client = GroupVANClient.from_shared_key(
+            "test_dev_123", "test_key_456", self.client._private_key
+        )
+        self.assertIsInstance(client, GroupVANClient)
+        verified_payload = jwt.decode(
+            client.generate_jwt(),
+            self.public_key,
+            algorithms=["RS256"],
+            audience="groupvan",
+        )
+        self.assertEqual(verified_payload["iss"], "test_dev_123")
+        client.close()
+
     def test_generate_jwt(self):
         """Test JWT generation"""
         token = self.client.generate_jwt()
@@ -56,10 +145,27 @@ class TestGroupVANClient(unittest.TestCase):
         self.assertIn("iat", decoded)
 
         # Check expiration (should be ~5 minutes from now)
-        current_time = math.floor(time.time())
+        current_time = int(time.time())
         self.assertGreater(decoded["exp"], current_time)
         self.assertLessEqual(decoded["exp"], current_time + 310)  # 5 min + buffer
 
+    def test_generate_jwt_escapes_claims(self):
+        """Test that ids needing JSON escaping produce valid claims"""
+        client = GroupVANClient(
+            developer_id='dev "quoted" \\ id',
+            key_id="key_é",
+            private_key_pem=self.private_key,
+        )
+        decoded = jwt.decode(
+            client.generate_jwt(),
+            self.public_key,
+            algorithms=["RS256"],
+            audience="groupvan",
+        )
+        self.assertEqual(decoded["iss"], 'dev "quoted" \\ id')
+        self.assertEqual(decoded["kid"], "key_é")
+        client.close()
+
     def test_jwt_verification(self):
         """Test that generated JWT can be verified with public key"""
         token = self.client.generate_jwt()
@@ -84,16 +190,17 @@ class TestGroupVANClient(unittest.TestCase):
         header = jwt.get_unverified_header(token)
 
         self.assertEqual(header["alg"], "RS256")
+        self.assertEqual(header["typ"], "JWT")
         self.assertEqual(header["kid"], "test_key_456")
         self.assertEqual(header["gv-ver"], "GV-JWT-V1")
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_make_authenticated_request(self, mock_request):
         """Test making authenticated requests"""
         # Setup mock response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"id": "catalog_123", "name": "Test Catalog"}
+        mock_response.content = b'{"id": "catalog_123", "name": "Test Catalog"}'
         mock_request.return_value = mock_response
 
         # Make request
@@ -118,13 +225,47 @@ class TestGroupVANClient(unittest.TestCase):
         self.assertTrue(headers["Authorization"].startswith("Bearer "))
         self.assertEqual(headers["Content-Type"], "application/json")
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
+    def test_make_authenticated_request_body(self, mock_request):
+        """Test that request bodies are sent as pre-encoded JSON"""
+        mock_request.return_value = Mock(status_code=201)
+
+        self.client.make_authenticated_request(
+            method="POST",
+            endpoint="/catalogs",
+            data={"name": "New Catalog", "type": "products"},
+        )
+
+        call_args = mock_request.call_args
+        self.assertNotIn("json", call_args.kwargs)
+        self.assertEqual(
+            json.loads(call_args.kwargs["data"]),
+            {"name": "New Catalog", "type": "products"},
+        )
+        self.assertEqual(
+            call_args.kwargs["headers"]["Content-Type"], "application/json"
+        )
+
+    def test_json_dumps_non_str_keys(self):
+        """Test that request bodies with non-str keys serialize like stdlib json"""
+        data = {"prices": {1: 9.99}}
+        self.assertEqual(json.loads(_json_dumps(data)), json.loads(json.dumps(data)))
+
+        with patch("client.orjson", None):
+            self.assertEqual(json.loads(_json_dumps(data)), {"prices": {"1": 9.99}})
+
+    def test_json_dumps_falls_back_to_stdlib(self):
+        """Test that bodies orjson rejects are still encoded by stdlib json"""
+        data = {"id": 2**64}
+        self.assertEqual(_json_dumps(data), b'{"id":18446744073709551616}')
+
+    @patch("requests.Session.request")
     def test_get_catalog(self, mock_request):
         """Test get_catalog method"""
         # Setup mock response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"id": "catalog_123", "name": "Test Catalog"}
+        mock_response.content = b'{"id": "catalog_123", "name": "Test Catalog"}'
         mock_request.return_value = mock_response
 
         # Get catalog
@@ -134,7 +275,7 @@ class TestGroupVANClient(unittest.TestCase):
         self.assertEqual(result["id"], "catalog_123")
         self.assertEqual(result["name"], "Test Catalog")
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_get_catalog_error(self, mock_request):
         """Test get_catalog error handling"""
         # Setup mock error response
@@ -150,19 +291,21 @@ class TestGroupVANClient(unittest.TestCase):
         self.assertIn("Failed to get catalog", str(context.exception))
         self.assertIn("404", str(context.exception))
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_list_catalogs(self, mock_request):
         """Test list_catalogs method"""
         # Setup mock response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "items": [
-                {"id": "catalog_1", "name": "Catalog 1"},
-                {"id": "catalog_2", "name": "Catalog 2"},
-            ],
-            "total": 2,
-        }
+        mock_response.content = json.dumps(
+            {
+                "items": [
+                    {"id": "catalog_1", "name": "Catalog 1"},
+                    {"id": "catalog_2", "name": "Catalog 2"},
+                ],
+                "total": 2,
+            }
+        ).encode()
         mock_request.return_value = mock_response
 
         # List catalogs
@@ -177,32 +320,429 @@ class TestGroupVANClient(unittest.TestCase):
         self.assertEqual(call_args.kwargs["params"]["limit"], 10)
         self.assertEqual(call_args.kwargs["params"]["offset"], 0)
 
+    @unittest.skipUnless(HAS_IJSON, "ijson is not installed")
+    @patch("requests.Session.request")
+    def test_list_catalogs_stream(self, mock_request):
+        """Test that streamed listings yield catalog items incrementally"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.raw = io.BytesIO(
+            b'{"items": [{"id": "catalog_1", "price": 1.5}, {"id": "catalog_2"}],'
+            b' "total": 2}'
+        )
+        mock_request.return_value = mock_response
+
+        result = self.client.list_catalogs(limit=10, stream=True)
+
+        self.assertTrue(mock_request.call_args.kwargs["stream"])
+        items = list(result)
+        self.assertEqual([item["id"] for item in items], ["catalog_1", "catalog_2"])
+        self.assertEqual(items[0]["price"], 1.5)
+        mock_response.close.assert_called_once()
+
+    def test_session_created_lazily(self):
+        """Test that the HTTP session is only created for the first request"""
+        self.assertIsNone(self.client._session)
+        session = self.client._get_session()
+        self.assertIs(self.client._get_session(), session)
+
+    def test_import_does_not_load_http_stack(self):
+        """Test that importing the client defers importing requests and jwt"""
+        code = (
+            "import sys, client; "
+            "assert 'requests' not in sys.modules, 'requests'; "
+            "assert 'jwt' not in sys.modules, 'jwt'"
+        )
+        subprocess.run(
+            [sys.executable, "-c", code],
+            check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+
+    def test_persistent_server_error_after_retries(self):
+        """Test that a 503 outlasting the retries surfaces as the usual error"""
+        hits = []
+
+        class UnavailableHandler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                hits.append(self.path)
+                body = b"Service unavailable"
+                self.send_response(503)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = http.server.HTTPServer(("127.0.0.1", 0), UnavailableHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        # Route plain HTTP through the client's retrying adapter, minus backoff
+        session = self.client._get_session()
+        adapter = session.get_adapter("https://api.groupvan.com")
+        adapter.max_retries = adapter.max_retries.new(backoff_factor=0)
+        session.mount("http://", adapter)
+        self.client.base_url = f"http://127.0.0.1:{server.server_port}/v3"
+
+        with self.assertRaises(Exception) as context:
+            self.client.get_catalog("x")
+
+        self.assertIn("Failed to get catalog: 503", str(context.exception))
+        self.assertIn("Service unavailable", str(context.exception))
+        self.assertEqual(len(hits), 4)  # first attempt + 3 retries
+
+    def test_context_manager_closes_session(self):
+        """Test that leaving the context manager closes the HTTP session"""
+        self.client._get_session()
+        with patch("requests.Session.close") as mock_close:
+            with self.client as client:
+                self.assertIs(client, self.client)
+            mock_close.assert_called_once()
+
     def test_custom_expiration(self):
         """Test JWT generation with custom expiration"""
         # Generate token with 10 minute expiration
         token = self.client.generate_jwt(expires_in=600)
         decoded = jwt.decode(token, options={"verify_signature": False})
 
-        current_time = math.floor(time.time())
+        current_time = int(time.time())
         # Check expiration is ~10 minutes from now
         self.assertGreater(decoded["exp"], current_time + 590)
         self.assertLessEqual(decoded["exp"], current_time + 610)
 
+    def test_jwt_cache_reuses_token(self):
+        """Test that a still-valid token is reused instead of re-signed"""
+        first = self.client.generate_jwt()
+        second = self.client.generate_jwt()
+        self.assertEqual(first, second)
+
+    def test_jwt_cache_refreshes_near_expiry(self):
+        """Test that a token close to expiry is re-minted"""
+        first = self.client.generate_jwt()
+        # Pretend the cached token has reached its refresh deadline
+        self.client._cached_refresh_at_ns = time.monotonic_ns()
+        with patch("time.time_ns", return_value=time.time_ns() + 1_000_000_000):
+            second = self.client.generate_jwt()
+        self.assertNotEqual(first, second)
+
+    def test_jwt_cache_refreshes_after_suspend(self):
+        """Test that a wall-clock jump the monotonic clock missed re-mints"""
+        first = self.client.generate_jwt()
+        # Simulate a suspend/resume: wall clock moves, monotonic clock does not
+        with patch("time.time", return_value=time.time() + 600), patch(
+            "time.time_ns", return_value=time.time_ns() + 600_000_000_000
+        ):
+            second = self.client.generate_jwt()
+        self.assertNotEqual(first, second)
+        decoded = jwt.decode(second, options={"verify_signature": False})
+        self.assertGreater(decoded["exp"], int(time.time()) + 600)
+
+    def test_jwt_cache_respects_expiration(self):
+        """Test that a different expires_in does not reuse the cached token"""
+        token = self.client.generate_jwt()
+        longer = self.client.generate_jwt(expires_in=600)
+        self.assertNotEqual(token, longer)
+
+    def test_short_lived_tokens_minted_once_per_second(self):
+        """Test that tokens too short-lived to cache are reused within a second"""
+        now_ns = time.time_ns()
+        with patch.object(self.client, "_sign", wraps=self.client._sign) as mock_sign:
+            with patch("time.time_ns", return_value=now_ns):
+                first = self.client.generate_jwt(expires_in=10)
+                second = self.client.generate_jwt(expires_in=10)
+            self.assertEqual(first, second)
+            self.assertEqual(mock_sign.call_count, 1)
+
+            with patch("time.time_ns", return_value=now_ns + 1_000_000_000):
+                third = self.client.generate_jwt(expires_in=10)
+            self.assertNotEqual(first, third)
+            self.assertEqual(mock_sign.call_count, 2)
+
+    def test_pkcs1_der_private_key(self):
+        """Test generating and loading a PKCS#1 DER private key"""
+        private_der, public_key = generate_rsa_key_pair(format="pkcs1_der")
+        self.assertIsInstance(private_der, bytes)
+        self.assertIn("BEGIN PUBLIC KEY", public_key)
+
+        client = GroupVANClient(
+            developer_id="test_dev_123",
+            key_id="test_key_456",
+            private_key_pem=private_der,
+        )
+        verified_payload = jwt.decode(
+            client.generate_jwt(),
+            public_key,
+            algorithms=["RS256"],
+            audience="groupvan",
+        )
+        self.assertEqual(verified_payload["iss"], "test_dev_123")
+        client.close()
+
+    def test_unsupported_key_format(self):
+        """Test that unknown private key formats are rejected"""
+        with self.assertRaises(ValueError):
+            generate_rsa_key_pair(format="jwk")  # type: ignore[call-overload]
+
     def test_rsa_key_size(self):
         """Test RSA key generation with different key sizes"""
         # Test 2048-bit key (default)
-        private_2048, public_2048 = generate_rsa_key_pair(2048)
+        private_2048, public_2048 = cached_rsa_key_pair(2048)
         self.assertIsNotNone(private_2048)
         self.assertIsNotNone(public_2048)
 
-        # Test 4096-bit key
-        private_4096, public_4096 = generate_rsa_key_pair(4096)
+        # Test 4096-bit key (slow to sign with, so a warning is emitted)
+        with self.assertWarns(PerformanceWarning):
+            private_4096, public_4096 = cached_rsa_key_pair(4096)
         self.assertIsNotNone(private_4096)
         self.assertIsNotNone(public_4096)
 
         # 4096-bit keys should be longer
         self.assertGreater(len(private_4096), len(private_2048))
 
+    def test_es256_client(self):
+        """Test JWT generation and verification with an EC P-256 key"""
+        private_key, public_key = generate_ec_key_pair()
+        self.assertIn("BEGIN PRIVATE KEY", private_key)
+
+        client = GroupVANClient(
+            developer_id="test_dev_123",
+            key_id="test_key_456",
+            private_key_pem=private_key,
+        )
+        self.assertEqual(client.algorithm, "ES256")
+
+        token = client.generate_jwt()
+        self.assertEqual(jwt.get_unverified_header(token)["alg"], "ES256")
+
+        verified_payload = jwt.decode(
+            token, public_key, algorithms=["ES256"], audience="groupvan"
+        )
+        self.assertEqual(verified_payload["iss"], "test_dev_123")
+
+    def test_eddsa_client(self):
+        """Test JWT generation and verification with an Ed25519 key"""
+        private_key, public_key = generate_ed25519_key_pair()
+
+        client = GroupVANClient(
+            developer_id="test_dev_123",
+            key_id="test_key_456",
+            private_key_pem=private_key,
+        )
+        self.assertEqual(client.algorithm, "EdDSA")
+
+        token = client.generate_jwt()
+        header = jwt.get_unverified_header(token)
+        self.assertEqual(header["alg"], "EdDSA")
+        self.assertEqual(header["kid"], "test_key_456")
+
+        verified_payload = jwt.decode(
+            token, public_key, algorithms=["EdDSA"], audience="groupvan"
+        )
+        self.assertEqual(verified_payload["iss"], "test_dev_123")
+
+
+class TestOpenSSLDiagnostics(unittest.TestCase):
+    """Test cases for the OpenSSL assembly check"""
+
+    @patch.dict("os.environ", {}, clear=True)
+    @patch("client._libcrypto_cflags", return_value="compiler: gcc -O3")
+    @patch("client._cryptography_openssl_cflags", return_value="compiler: cc -O3")
+    def test_check_openssl_asm(self, mock_crypto_cflags, mock_cflags):
+        """Test the report for an OpenSSL built with assembly"""
+        report = check_openssl_asm()
+        self.assertEqual(report["problems"], [])
+        self.assertIn("OpenSSL", report["cryptography_openssl_version"])
+        self.assertEqual(report["cryptography_openssl_cflags"], "compiler: cc -O3")
+        self.assertEqual(report["system_libcrypto_cflags"], "compiler: gcc -O3")
+
+    def test_cryptography_openssl_cflags(self):
+        """Test that the bundled OpenSSL's build flags can be read"""
+        self.assertIn("compiler:", _cryptography_openssl_cflags())
+
+    @patch.dict("os.environ", {}, clear=True)
+    @patch("client._libcrypto_cflags", return_value="compiler: gcc -O3")
+    @patch(
+        "client._cryptography_openssl_cflags",
+        return_value="compiler: cc -DOPENSSL_NO_ASM",
+    )
+    def test_check_cryptography_no_asm(self, mock_crypto_cflags, mock_cflags):
+        """Test that a no-asm cryptography OpenSSL is reported for signing"""
+        with self.assertWarns(PerformanceWarning):
+            report = check_openssl_asm()
+        self.assertEqual(len(report["problems"]), 1)
+        self.assertIn("JWT signing", report["problems"][0])
+
+    @patch.dict("os.environ", {}, clear=True)
+    @patch("client._libcrypto_cflags", return_value="compiler: gcc -DOPENSSL_NO_ASM")
+    @patch("client._cryptography_openssl_cflags", return_value="compiler: cc -O3")
+    def test_check_openssl_no_asm(self, mock_crypto_cflags, mock_cflags):
+        """Test that a no-asm system libcrypto is reported as a TLS problem"""
+        with self.assertWarns(PerformanceWarning):
+            report = check_openssl_asm()
+        self.assertEqual(len(report["problems"]), 1)
+        self.assertIn("system libcrypto", report["problems"][0])
+        self.assertNotIn("JWT signing", report["problems"][0])
+
+    @patch.dict("os.environ", {"OPENSSL_ia32cap": "~0x200000200000000"})
+    @patch("client._libcrypto_cflags", return_value=None)
+    @patch("client._cryptography_openssl_cflags", return_value=None)
+    def test_check_openssl_ia32cap_mask(self, mock_crypto_cflags, mock_cflags):
+        """Test that masking out AES-NI via OPENSSL_ia32cap is reported"""
+        with self.assertWarns(PerformanceWarning):
+            report = check_openssl_asm()
+        self.assertIn("AES-NI", report["problems"][0])
+
+
+class TestJWTVerifier(unittest.TestCase):
+    """Test cases for the caching JWT verifier"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Generate the RSA key pair shared by all tests"""
+        cls.private_key, cls.public_key = cached_rsa_key_pair(2048)
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.client = GroupVANClient(
+            developer_id="test_dev_123",
+            key_id="test_key_456",
+            private_key_pem=self.private_key,
+        )
+        self.verifier = JWTVerifier(self.public_key)
+
+    def tearDown(self):
+        """Release the client's HTTP session"""
+        self.client.close()
+
+    def test_verify(self):
+        """Test that a valid token verifies and returns its claims"""
+        claims = self.verifier.verify(self.client.generate_jwt())
+        self.assertEqual(claims["iss"], "test_dev_123")
+        self.assertEqual(claims["aud"], "groupvan")
+
+    def test_verify_caches_result(self):
+        """Test that a verified token is not re-verified while cached"""
+        token = self.client.generate_jwt()
+        self.verifier.verify(token)
+
+        with patch("jwt.decode") as mock_decode:
+            claims = self.verifier.verify(token)
+        mock_decode.assert_not_called()
+        self.assertEqual(claims["kid"], "test_key_456")
+
+    def test_verify_cache_expiry(self):
+        """Test that cache entries are dropped once their TTL elapses"""
+        verifier = JWTVerifier(self.public_key, ttl=1)
+        token = self.client.generate_jwt()
+        verifier.verify(token)
+
+        later = time.monotonic_ns() + 2_000_000_000
+        with patch("time.monotonic_ns", return_value=later):
+            with patch("jwt.decode", wraps=jwt.decode) as mock_decode:
+                verifier.verify(token)
+        mock_decode.assert_called_once()
+
+    def test_verify_cache_rechecks_exp(self):
+        """Test that a cache hit past the token's exp goes back to jwt.decode"""
+        token = self.client.generate_jwt()
+        self.verifier.verify(token)
+
+        # Wall clock moves past exp while the monotonic clock stays put
+        with patch("time.time", return_value=time.time() + 600), patch(
+            "jwt.decode", wraps=jwt.decode
+        ) as decode:
+            self.verifier.verify(token)
+        decode.assert_called_once()
+
+    def test_verify_invalid_token(self):
+        """Test that tampered tokens are rejected and not cached"""
+        other_private, _ = generate_ed25519_key_pair()
+        other = GroupVANClient("test_dev_123", "test_key_456", other_private)
+        with self.assertRaises(jwt.InvalidTokenError):
+            self.verifier.verify(other.generate_jwt())
+        self.assertEqual(len(self.verifier._cache), 0)
+        other.close()
+
+    def test_verify_token_without_exp(self):
+        """Test that a correctly signed token without exp is rejected"""
+        token = jwt.encode(
+            {"aud": "groupvan", "iss": "test_dev_123"},
+            self.private_key,
+            algorithm="RS256",
+        )
+        with self.assertRaises(jwt.MissingRequiredClaimError):
+            self.verifier.verify(token)
+        self.assertEqual(len(self.verifier._cache), 0)
+
+    def test_verify_cache_maxsize(self):
+        """Test that the cache never grows beyond maxsize"""
+        verifier = JWTVerifier(self.public_key, maxsize=2)
+        for expires_in in (300, 301, 302):
+            verifier.verify(self.client.generate_jwt(expires_in=expires_in))
+        self.assertEqual(len(verifier._cache), 2)
+
+
+@unittest.skipUnless(HAS_HTTPX, "httpx is not installed")
+class TestAsyncGroupVANClient(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the asyncio GroupVAN API Client"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Generate the RSA key pair shared by all tests"""
+        cls.private_key, cls.public_key = cached_rsa_key_pair(2048)
+
+    async def asyncSetUp(self):
+        """Set up test fixtures"""
+        self.client = AsyncGroupVANClient(
+            developer_id="test_dev_123",
+            key_id="test_key_456",
+            private_key_pem=self.private_key,
+        )
+
+    async def asyncTearDown(self):
+        """Release the client's HTTP connections"""
+        await self.client.aclose()
+
+    @patch("httpx.AsyncClient.request", new_callable=AsyncMock)
+    async def test_get_catalog(self, mock_request):
+        """Test get_catalog sends an authenticated request"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"id": "catalog_123", "name": "Test Catalog"}'
+        mock_request.return_value = mock_response
+
+        result = await self.client.get_catalog("catalog_123")
+        self.assertEqual(result["id"], "catalog_123")
+
+        call_args = mock_request.call_args
+        self.assertEqual(call_args.kwargs["method"], "GET")
+        self.assertEqual(
+            call_args.kwargs["url"], "https://api.groupvan.com/v3/catalogs/catalog_123"
+        )
+        token = call_args.kwargs["headers"]["Authorization"].removeprefix("Bearer ")
+        verified_payload = jwt.decode(
+            token, self.public_key, algorithms=["RS256"], audience="groupvan"
+        )
+        self.assertEqual(verified_payload["iss"], "test_dev_123")
+
+    @patch("httpx.AsyncClient.request", new_callable=AsyncMock)
+    async def test_list_catalogs_error(self, mock_request):
+        """Test list_catalogs error handling"""
+        mock_response = Mock()
+        mock_response.status_code = 500
+        mock_response.text = "Internal error"
+        mock_request.return_value = mock_response
+
+        with self.assertRaises(Exception) as context:
+            await self.client.list_catalogs()
+
+        self.assertIn("Failed to list catalogs", str(context.exception))
+        self.assertIn("500", str(context.exception))
+
 
 if __name__ == "__main__":
     unittest.main()